@@ -1,35 +1,70 @@
+import asyncio
 import json
 import mimetypes
+import os
 import uuid
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from io import BytesIO
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Dict,
     List,
     Literal,
     Optional,
+    Tuple,
     TypedDict,
     TypeVar,
     Union,
 )
 
 import filetype
-from pydantic import Field
-from pydantic.dataclasses import dataclass
-from syncer import asyncio
 
+try:
+    # Optional C-extension JSON encoder, much faster on dict/list payloads.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from chainlit._fastuuid import fastuuid
 from chainlit.context import context
 from chainlit.data import get_data_layer
 from chainlit.logger import logger
 
+# Kept for backward compatibility; send() now reads the per-class
+# default_mime class attribute instead.
 mime_types = {
     "text": "text/plain",
     "tasklist": "application/json",
     "plotly": "application/json",
 }
 
+# Top-level mime type prefixes that map to a dedicated element type.
+_MIME_PREFIX_TYPES: Dict[str, "ElementType"] = {
+    "image": "image",
+    "audio": "audio",
+    "video": "video",
+}
+
+# Parse the system mime type tables once at import time so the first
+# `guess_type` call in a hot path does not pay the initialization cost.
+mimetypes.init()
+
+
+@lru_cache(maxsize=1024)
+def _cached_filetype_mime(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Sniff the mime type of a file on disk with `filetype.guess`.
+
+    The mtime/size arguments only serve as cache-key components, so repeated
+    sends of an unchanged file skip the open+read that `filetype.guess` does.
+    """
+    file_type = filetype.guess(path)
+    return file_type.mime if file_type else None
+
+
 ElementType = Literal[
     "image",
     "text",
@@ -66,16 +101,183 @@ class ElementDict(TypedDict, total=False):
     mime: Optional[str]
 
 
-@dataclass
+# (ElementDict key, instance attribute) pairs emitted by to_dict, in emission
+# order. "type" is not listed: it is a per-class constant baked into the
+# specialized function generated by _specialize_to_dict.
+_TO_DICT_FIELDS = (
+    ("id", "id"),
+    ("threadId", "thread_id"),
+    ("url", "url"),
+    ("chainlitKey", "chainlit_key"),
+    ("name", "name"),
+    ("display", "display"),
+    ("objectKey", "object_key"),
+    ("size", "size"),
+    ("props", "props"),
+    ("page", "page"),
+    ("autoPlay", "auto_play"),
+    ("playerConfig", "player_config"),
+    ("language", "language"),
+    ("forId", "for_id"),
+    ("mime", "mime"),
+)
+
+
+_DATA_LAYER_UNSET = object()
+
+
+def _cached_data_layer():
+    """Resolve the data layer once per session.
+
+    ``get_data_layer()`` is a singleton lookup with first-call
+    initialization; caching the resolved reference (including None) on the
+    session trims the repeated lookups on the emit path.
+    """
+    session = context.session
+    data_layer = getattr(session, "_data_layer_cache", _DATA_LAYER_UNSET)
+    if data_layer is _DATA_LAYER_UNSET:
+        data_layer = get_data_layer()
+        session._data_layer_cache = data_layer
+    return data_layer
+
+
+class _ElementCreateBatcher:
+    """Coalesce data-layer element writes issued close together.
+
+    Elements enqueued within one window are flushed as a single batch through
+    ``data_layer.create_elements`` when the data layer provides it, and in
+    parallel through ``create_element`` otherwise, amortizing one round trip
+    per element into one per batch. Batches are kept per session so the write
+    runs under the session context that produced the elements.
+
+    Deletes and session teardown must call ``flush`` first: a batched create
+    landing after a delete would resurrect the element, and a disconnect
+    within the flush window would silently drop it.
+    """
+
+    max_batch_size = 64
+    flush_delay = 0.05  # seconds
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, List[Element]] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        self._inflight: Dict[str, set] = {}
+
+    def enqueue(self, element: "Element") -> None:
+        session_id = context.session.id
+        pending = self._pending.setdefault(session_id, [])
+        pending.append(element)
+        if len(pending) >= self.max_batch_size:
+            self._flush(session_id)
+        elif session_id not in self._flush_tasks:
+            # The timer task inherits the caller's contextvars, so the
+            # data-layer write still sees the right session.
+            self._flush_tasks[session_id] = asyncio.create_task(
+                self._delayed_flush(session_id)
+            )
+
+    def _flush(self, session_id: str) -> None:
+        timer = self._flush_tasks.pop(session_id, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(session_id, None)
+        if batch:
+            self._track(session_id, asyncio.create_task(self._persist(batch)))
+
+    async def _delayed_flush(self, session_id: str) -> None:
+        await asyncio.sleep(self.flush_delay)
+        self._flush_tasks.pop(session_id, None)
+        batch = self._pending.pop(session_id, None)
+        if batch:
+            # Persist in a tracked task rather than inline so flush() can
+            # await writes that were already in flight when it was called.
+            self._track(session_id, asyncio.create_task(self._persist(batch)))
+
+    def _track(self, session_id: str, task: asyncio.Task) -> None:
+        self._inflight.setdefault(session_id, set()).add(task)
+        task.add_done_callback(lambda t: self._untrack(session_id, t))
+
+    def _untrack(self, session_id: str, task: asyncio.Task) -> None:
+        tasks = self._inflight.get(session_id)
+        if tasks is not None:
+            tasks.discard(task)
+            if not tasks:
+                self._inflight.pop(session_id, None)
+
+    async def flush(self, session_id: str) -> None:
+        """Persist every pending or in-flight create for a session."""
+        timer = self._flush_tasks.pop(session_id, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(session_id, None)
+        if batch:
+            await self._persist(batch)
+        if inflight := self._inflight.get(session_id):
+            await asyncio.gather(*list(inflight), return_exceptions=True)
+
+    async def _persist(self, batch: List["Element"]) -> None:
+        data_layer = _cached_data_layer()
+        if data_layer is None:
+            return
+        if (
+            create_elements := getattr(data_layer, "create_elements", None)
+        ) is not None:
+            try:
+                await create_elements(batch)
+            except Exception as e:
+                logger.error(f"Failed to create elements: {e!s}")
+            return
+        results = await asyncio.gather(
+            *[data_layer.create_element(element) for element in batch],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to create element: {result!s}")
+
+
+_element_create_batcher = _ElementCreateBatcher()
+
+
+def _specialize_to_dict(
+    element_type: str,
+) -> Tuple[Dict[str, Any], Callable[["Element"], "ElementDict"]]:
+    """Generate a dict template and ``to_dict`` specialized for one element type.
+
+    The template is a prototype dict with the element type baked in as a
+    constant; the generated function copies it (a single C-level hashtable
+    copy, no per-key hashing) and patches the instance fields with direct
+    attribute loads.
+    """
+    template: Dict[str, Any] = {}
+    for index, (key, _) in enumerate(_TO_DICT_FIELDS):
+        if index == 2:
+            # Keep "type" in its historical position in the payload.
+            template["type"] = element_type
+        template[key] = None
+    lines = ["def to_dict(self):", "    d = _template.copy()"]
+    lines += [f'    d["{key}"] = self.{attr}' for key, attr in _TO_DICT_FIELDS]
+    lines.append("    return d")
+    namespace: Dict[str, Any] = {"_template": template}
+    exec("\n".join(lines), namespace)
+    return template, namespace["to_dict"]
+
+
+@dataclass(slots=True)
 class Element:
     # Thread id
-    thread_id: str = Field(default_factory=lambda: context.session.thread_id)
+    thread_id: str = field(default_factory=lambda: context.session.thread_id)
     # The type of the element. This will be used to determine how to display the element in the UI.
     type: ClassVar[ElementType]
+    # Default mime type for the element type, when it is not inferred from content.
+    default_mime: ClassVar[Optional[str]] = None
+    # Prototype dict copied by the specialized to_dict; set per subclass in
+    # __init_subclass__.
+    _dict_template: ClassVar[Dict[str, Any]]
     # Name of the element, this will be used to reference the element in the UI.
     name: str = ""
     # The ID of the element. This is set automatically when the element is sent to the UI.
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=fastuuid)
     # The key of the element hosted on Chainlit.
     chainlit_key: Optional[str] = None
     # The URL of the element if already hosted somewhere else.
@@ -87,7 +289,7 @@ class Element:
     # The byte content of the element.
     content: Optional[Union[bytes, str]] = None
     # Controls how the image element should be displayed in the UI. Choices are “side” (default), “inline”, or “page”.
-    display: ElementDisplay = Field(default="inline")
+    display: ElementDisplay = "inline"
     # Controls element size
     size: Optional[ElementSize] = None
     # The ID of the message this element is associated with.
@@ -96,14 +298,39 @@ class Element:
     language: Optional[str] = None
     # Mime type, inferred based on content if not provided
     mime: Optional[str] = None
-
+    # The page to display, only relevant for pdf elements.
+    page: Optional[int] = None
+    # The props to pass to the component, only relevant for custom elements.
+    props: Optional[Dict] = None
+    # Whether to autoplay, only relevant for audio elements.
+    auto_play: Optional[bool] = None
+    # Player overrides, only relevant for video elements.
+    player_config: Optional[dict] = None
+    # Runtime persistence state, set by _create.
+    persisted: bool = field(default=False, init=False, repr=False, compare=False)
+    updatable: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # Two-arg super() is used throughout the hierarchy: with slots=True the
+    # dataclass decorator recreates each class, and on Python < 3.12 the
+    # zero-arg form still closes over the discarded pre-slots class.
+    def __init_subclass__(cls, **kwargs) -> None:
+        super(Element, cls).__init_subclass__(**kwargs)
+        element_type = getattr(cls, "type", None)
+        if element_type is not None:
+            template, to_dict = _specialize_to_dict(element_type)
+            cls._dict_template = template
+            cls.to_dict = to_dict  # type: ignore[method-assign, assignment]
+
+    # Subclasses that synthesize their content (Pyplot, Plotly, Dataframe,
+    # CustomElement) override __post_init__ without calling super(): they
+    # type-check their inputs instead, and the url/path/content presence
+    # check below does not apply to them.
     def __post_init__(self) -> None:
-        self.persisted = False
-        self.updatable = False
-
         if not self.url and not self.path and not self.content:
             raise ValueError("Must provide url, path or content to instantiate element")
 
+    # Generic fallback; subclasses get a specialized version generated in
+    # __init_subclass__. Keep the keys in sync with _TO_DICT_FIELDS.
     def to_dict(self) -> ElementDict:
         _dict = ElementDict(
             {
@@ -114,15 +341,15 @@ class Element:
                 "chainlitKey": self.chainlit_key,
                 "name": self.name,
                 "display": self.display,
-                "objectKey": getattr(self, "object_key", None),
-                "size": getattr(self, "size", None),
-                "props": getattr(self, "props", None),
-                "page": getattr(self, "page", None),
-                "autoPlay": getattr(self, "auto_play", None),
-                "playerConfig": getattr(self, "player_config", None),
-                "language": getattr(self, "language", None),
-                "forId": getattr(self, "for_id", None),
-                "mime": getattr(self, "mime", None),
+                "objectKey": self.object_key,
+                "size": self.size,
+                "props": self.props,
+                "page": self.page,
+                "autoPlay": self.auto_play,
+                "playerConfig": self.player_config,
+                "language": self.language,
+                "forId": self.for_id,
+                "mime": self.mime,
             }
         )
         return _dict
@@ -138,13 +365,19 @@ class Element:
         Returns:
             Element: An instance of the appropriate Element subclass
         """
-        element_id = e_dict.get("id", str(uuid.uuid4()))
+        element_id = e_dict.get("id") or fastuuid()
+        if isinstance(element_id, bytes):
+            # Some stores keep ids as raw 16-byte UUIDs; normalize to the
+            # canonical string form used everywhere else.
+            element_id = str(uuid.UUID(bytes=element_id))
         for_id = e_dict.get("forId")
         name = e_dict.get("name", "")
         type = e_dict.get("type", "file")
-        path = str(e_dict.get("path")) if e_dict.get("path") else None
-        url = str(e_dict.get("url")) if e_dict.get("url") else None
-        content = str(e_dict.get("content")) if e_dict.get("content") else None
+        # Single dict lookup per field; str() is a no-op on values that are
+        # already strings but keeps tolerating path-like inputs.
+        path = str(p) if (p := e_dict.get("path")) else None
+        url = str(u) if (u := e_dict.get("url")) else None
+        content = str(c) if (c := e_dict.get("content")) else None
         object_key = e_dict.get("objectKey")
         chainlit_key = e_dict.get("chainlitKey")
         display = e_dict.get("display", "inline")
@@ -188,28 +421,18 @@ class Element:
     @classmethod
     def infer_type_from_mime(cls, mime_type: str):
         """Infer the element type from a mime type. Useful to know which element to instantiate from a file upload."""
-        if "image" in mime_type:
-            return "image"
-
-        elif mime_type == "application/pdf":
+        if mime_type == "application/pdf":
             return "pdf"
 
-        elif "audio" in mime_type:
-            return "audio"
-
-        elif "video" in mime_type:
-            return "video"
-
-        else:
-            return "file"
+        return _MIME_PREFIX_TYPES.get(mime_type.partition("/")[0], "file")
 
     async def _create(self, persist=True) -> bool:
         if self.persisted and not self.updatable:
             return True
 
-        if (data_layer := get_data_layer()) and persist:
+        if persist and _cached_data_layer():
             try:
-                asyncio.create_task(data_layer.create_element(self))
+                _element_create_batcher.enqueue(self)
             except Exception as e:
                 logger.error(f"Failed to create element: {e!s}")
         if not self.url and (not self.chainlit_key or self.updatable):
@@ -226,8 +449,11 @@ class Element:
         return True
 
     async def remove(self):
-        data_layer = get_data_layer()
+        data_layer = _cached_data_layer()
         if data_layer:
+            # Drain any batched create first so it cannot land after the
+            # delete and resurrect the element in the data layer.
+            await _element_create_batcher.flush(context.session.id)
             await data_layer.delete_element(self.id, self.thread_id)
         await context.emitter.emit("remove_element", {"id": self.id})
 
@@ -235,16 +461,31 @@ class Element:
         self.for_id = for_id
 
         if not self.mime:
-            if self.type in mime_types:
-                self.mime = mime_types[self.type]
-            elif self.path or isinstance(self.content, (bytes, bytearray)):
-                file_type = filetype.guess(self.path or self.content)
-                if file_type:
-                    self.mime = file_type.mime
-            elif self.url:
-                self.mime = mimetypes.guess_type(self.url)[0]
-
-        await self._create(persist=persist)
+            if self.default_mime:
+                self.mime = self.default_mime
+            else:
+                if self.path:
+                    # Extension lookup is a pure string operation; prefer it
+                    # over `filetype.guess`, which opens and reads the file.
+                    self.mime = mimetypes.guess_type(self.path)[0]
+                if not self.mime and self.path:
+                    # Fall back to content sniffing when the extension is
+                    # unknown or missing.
+                    stat = os.stat(self.path)
+                    self.mime = _cached_filetype_mime(
+                        self.path, stat.st_mtime_ns, stat.st_size
+                    )
+                elif not self.mime and isinstance(self.content, (bytes, bytearray)):
+                    file_type = filetype.guess(self.content)
+                    if file_type:
+                        self.mime = file_type.mime
+                if not self.mime and self.url:
+                    self.mime = mimetypes.guess_type(self.url)[0]
+
+        if not self.persisted or self.updatable:
+            # Already-persisted, non-updatable elements have nothing left to
+            # create; skip the coroutine call on re-sends.
+            await self._create(persist=persist)
 
         if not self.url and not self.chainlit_key:
             raise ValueError("Must provide url or chainlit key to send element")
@@ -255,22 +496,23 @@ class Element:
 ElementBased = TypeVar("ElementBased", bound=Element)
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(Element):
     type: ClassVar[ElementType] = "image"
 
     size: ElementSize = "medium"
 
 
-@dataclass
+@dataclass(slots=True)
 class Text(Element):
     """Useful to send a text (not a message) to the UI."""
 
     type: ClassVar[ElementType] = "text"
+    default_mime: ClassVar[Optional[str]] = "text/plain"
     language: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Pdf(Element):
     """Useful to send a pdf to the UI."""
 
@@ -279,7 +521,20 @@ class Pdf(Element):
     type: ClassVar[ElementType] = "pdf"
 
 
-@dataclass
+_mpl_figure_cls: Any = None
+
+
+def _get_mpl_figure_cls():
+    """Cache the matplotlib Figure class after the first import."""
+    global _mpl_figure_cls
+    if _mpl_figure_cls is None:
+        from matplotlib.figure import Figure
+
+        _mpl_figure_cls = Figure
+    return _mpl_figure_cls
+
+
+@dataclass(slots=True)
 class Pyplot(Element):
     """Useful to send a pyplot to the UI."""
 
@@ -292,18 +547,19 @@ class Pyplot(Element):
     figure: Any = None
 
     def __post_init__(self) -> None:
-        from matplotlib.figure import Figure
-
-        if not isinstance(self.figure, Figure):
+        if not isinstance(self.figure, _get_mpl_figure_cls()):
             raise TypeError("figure must be a matplotlib.figure.Figure")
 
         image = BytesIO()
         self.figure.savefig(
             image, dpi=200, bbox_inches="tight", backend="Agg", format="png"
         )
+        # One copy into a real bytes object: content is typed bytes | str and
+        # the storage clients (Azure upload_blob, boto3 put_object) do not
+        # accept a memoryview, so a zero-copy getbuffer() view is not an
+        # option here.
         self.content = image.getvalue()
-
-        super().__post_init__()
+        self.mime = "image/png"
 
 
 class TaskStatus(Enum):
@@ -313,33 +569,44 @@ class TaskStatus(Enum):
     DONE = "done"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     title: str
     status: TaskStatus = TaskStatus.READY
     forId: Optional[str] = None
-
-    def __init__(
-        self,
-        title: str,
-        status: TaskStatus = TaskStatus.READY,
-        forId: Optional[str] = None,
-    ):
-        self.title = title
-        self.status = status
-        self.forId = forId
+    _cached_dict: Optional[Dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_cached_dict":
+            # Any field change invalidates the serialized form.
+            object.__setattr__(self, "_cached_dict", None)
+
+    def to_dict(self) -> Dict:
+        cached = self._cached_dict
+        if cached is None:
+            cached = {
+                "title": self.title,
+                "status": self.status.value,
+                "forId": self.forId,
+            }
+            object.__setattr__(self, "_cached_dict", cached)
+        return cached
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskList(Element):
     type: ClassVar[ElementType] = "tasklist"
-    tasks: List[Task] = Field(default_factory=list, exclude=True)
+    default_mime: ClassVar[Optional[str]] = "application/json"
+    tasks: List[Task] = field(default_factory=list)
     status: str = "Ready"
     name: str = "tasklist"
     content: str = "dummy content to pass validation"
 
     def __post_init__(self) -> None:
-        super().__post_init__()
+        super(TaskList, self).__post_init__()
         self.updatable = True
 
     async def add_task(self, task: Task):
@@ -350,33 +617,34 @@ class TaskList(Element):
 
     async def send(self):
         await self.preprocess_content()
-        await super().send(for_id="")
+        await super(TaskList, self).send(for_id="")
 
     async def preprocess_content(self):
-        # serialize enum
-        tasks = [
-            {"title": task.title, "status": task.status.value, "forId": task.forId}
-            for task in self.tasks
-        ]
+        # Each task caches its serialized dict until one of its fields
+        # changes, so a status transition only rebuilds the mutated task
+        # instead of every task on every update.
+        tasks = [task.to_dict() for task in self.tasks]
 
         # store stringified json in content so that it's correctly stored in the database
-        self.content = json.dumps(
-            {
-                "status": self.status,
-                "tasks": tasks,
-            },
-            indent=4,
-            ensure_ascii=False,
-        )
+        payload = {
+            "status": self.status,
+            "tasks": tasks,
+        }
+        if orjson is not None:
+            self.content = orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+        else:
+            # Match orjson's 2-space indent so the stored content does not
+            # depend on whether the optional encoder is installed.
+            self.content = json.dumps(payload, indent=2, ensure_ascii=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Audio(Element):
     type: ClassVar[ElementType] = "audio"
     auto_play: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Video(Element):
     type: ClassVar[ElementType] = "video"
 
@@ -386,96 +654,142 @@ class Video(Element):
     player_config: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class File(Element):
     type: ClassVar[ElementType] = "file"
 
 
-@dataclass
+_plotly_modules: Any = None
+
+
+def _get_plotly_modules():
+    """Cache the plotly graph_objects and io modules after the first import."""
+    global _plotly_modules
+    if _plotly_modules is None:
+        from plotly import graph_objects, io
+
+        _plotly_modules = (graph_objects, io)
+    return _plotly_modules
+
+
+@dataclass(slots=True)
 class Plotly(Element):
-    """Useful to send a plotly to the UI."""
+    """Useful to send a plotly to the UI.
+
+    Figures built with ``plotly.graph_objects`` are already validated at
+    construction, so serialization skips plotly's schema walk by default.
+    Pass ``validate=True`` when the figure wraps hand-built dicts.
+    """
 
     type: ClassVar[ElementType] = "plotly"
+    default_mime: ClassVar[Optional[str]] = "application/json"
 
     size: ElementSize = "medium"
     # The type is set to Any because the figure is not serializable
     # and its actual type is checked in __post_init__.
     figure: Any = None
     content: str = ""
+    # Re-validate the figure spec during serialization.
+    validate: bool = False
 
     def __post_init__(self) -> None:
-        from plotly import graph_objects as go, io as pio
+        go, pio = _get_plotly_modules()
 
         if not isinstance(self.figure, go.Figure):
             raise TypeError("figure must be a plotly.graph_objects.Figure")
 
         self.figure.layout.autosize = True
         self.figure.layout.width = None
-        self.content = pio.to_json(self.figure, validate=True)
+        self.content = pio.to_json(self.figure, validate=self.validate)
         self.mime = "application/json"
 
-        super().__post_init__()
 
+# Cached DataFrame classes; False marks a library as unavailable so the
+# failed import is not retried on every construction.
+_pandas_df_cls: Any = None
+_polars_df_cls: Any = None
+
+
+def _get_pandas_df_cls():
+    global _pandas_df_cls
+    if _pandas_df_cls is None:
+        try:
+            from pandas import DataFrame
+
+            _pandas_df_cls = DataFrame
+        except ImportError:
+            _pandas_df_cls = False
+    return _pandas_df_cls or None
+
+
+def _get_polars_df_cls():
+    global _polars_df_cls
+    if _polars_df_cls is None:
+        try:
+            from polars import DataFrame
+
+            _polars_df_cls = DataFrame
+        except ImportError:
+            _polars_df_cls = False
+    return _polars_df_cls or None
 
-@dataclass
+
+@dataclass(slots=True)
 class Dataframe(Element):
     """Useful to send a pandas or polars DataFrame to the UI."""
 
     type: ClassVar[ElementType] = "dataframe"
+
     size: ElementSize = "large"
     data: Any = None  # The type is Any because it is checked in __post_init__.
 
     @staticmethod
     def _is_pandas_dataframe(data: Any) -> bool:
         """Check if data is a pandas DataFrame without requiring pandas."""
-        try:
-            from pandas import DataFrame as PandasDataFrame
-
-            return isinstance(data, PandasDataFrame)
-        except ImportError:
-            return False
+        df_cls = _get_pandas_df_cls()
+        return df_cls is not None and isinstance(data, df_cls)
 
     @staticmethod
     def _is_polars_dataframe(data: Any) -> bool:
         """Check if data is a polars DataFrame without requiring polars."""
-        try:
-            from polars import DataFrame as PolarsDataFrame
-
-            return isinstance(data, PolarsDataFrame)
-        except ImportError:
-            return False
+        df_cls = _get_polars_df_cls()
+        return df_cls is not None and isinstance(data, df_cls)
 
     def __post_init__(self) -> None:
         """Ensures the data is a pandas or polars DataFrame and converts it to JSON."""
-        if self._is_pandas_dataframe(self.data):
-            self.content = self.data.to_json(orient="split", date_format="iso")
-        elif self._is_polars_dataframe(self.data):
-            self.content = json.dumps(
-                {
-                    "columns": self.data.columns,
-                    "index": list(range(len(self.data))),
-                    "data": self.data.rows(),
-                },
-                default=str,
-            )
-        else:
+        is_pandas = self._is_pandas_dataframe(self.data)
+        if not is_pandas and not self._is_polars_dataframe(self.data):
             raise TypeError("data must be a pandas.DataFrame or polars.DataFrame")
 
-        super().__post_init__()
+        if is_pandas:
+            self.content = self.data.to_json(orient="split", date_format="iso")
+        else:
+            payload = {
+                "columns": self.data.columns,
+                "index": list(range(len(self.data))),
+                "data": [list(row) for row in self.data.rows()],
+            }
+            if orjson is not None:
+                self.content = orjson.dumps(payload, default=str).decode()
+            else:
+                self.content = json.dumps(payload, default=str, separators=(",", ":"))
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomElement(Element):
     """Useful to send a custom element to the UI."""
 
     type: ClassVar[ElementType] = "custom"
+
     mime: str = "application/json"
-    props: Dict = Field(default_factory=dict)
+    props: Dict = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        self.content = json.dumps(self.props)
-        super().__post_init__()
+        if orjson is not None:
+            self.content = orjson.dumps(self.props).decode()
+        else:
+            self.content = json.dumps(self.props, separators=(",", ":"))
         self.updatable = True
 
     async def update(self):
-        await super().send(self.for_id)
+        await super(CustomElement, self).send(self.for_id)
@@ -200,6 +200,17 @@ class BaseSession:
 
         return {"id": file_id}
 
+    async def _flush_element_creates(self):
+        """Drain batched data-layer element creates before the session goes away."""
+        from chainlit.element import _element_create_batcher
+
+        try:
+            await _element_create_batcher.flush(self.id)
+        except Exception:
+            logger.debug(
+                "Error flushing element creates during session delete", exc_info=True
+            )
+
     def to_persistable(self) -> Dict:
         from chainlit.config import config
         from chainlit.user_session import user_sessions
@@ -249,6 +260,7 @@ class HTTPSession(BaseSession):
 
     async def delete(self):
         """Delete the session."""
+        await self._flush_element_creates()
         if self.files_dir.is_dir():
             shutil.rmtree(self.files_dir)
 
@@ -372,6 +384,7 @@ class WebsocketSession(BaseSession):
 
     async def delete(self):
         """Delete the session."""
+        await self._flush_element_creates()
         if self.files_dir.is_dir():
             shutil.rmtree(self.files_dir)
         ws_sessions_sid.pop(self.socket_id, None)
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import uuid
 from unittest.mock import AsyncMock
@@ -357,6 +358,41 @@ class TestTaskListElement:
             assert "done" in tasklist.content
             assert "In Progress" in tasklist.content
 
+    async def test_tasklist_preprocess_content_reflects_task_mutation(
+        self, mock_chainlit_context
+    ):
+        """Test that mutating a task after a first serialization is reflected."""
+        async with mock_chainlit_context:
+            tasklist = TaskList(name="test_tasklist")
+            task = Task(title="Test Task", status=TaskStatus.RUNNING)
+            await tasklist.add_task(task)
+
+            await tasklist.preprocess_content()
+            assert "running" in tasklist.content
+
+            task.status = TaskStatus.DONE
+            await tasklist.preprocess_content()
+            assert "done" in tasklist.content
+
+    async def test_tasklist_content_stable_without_orjson(
+        self, mock_chainlit_context, monkeypatch
+    ):
+        """Test that the stdlib fallback serializes the same payload as orjson."""
+        from chainlit import element as element_module
+
+        async with mock_chainlit_context:
+            tasklist = TaskList(name="test_tasklist", status="In Progress")
+            await tasklist.add_task(Task(title="Test Task", status=TaskStatus.DONE))
+
+            await tasklist.preprocess_content()
+            default_content = tasklist.content
+
+            monkeypatch.setattr(element_module, "orjson", None)
+            await tasklist.preprocess_content()
+            fallback_content = tasklist.content
+
+            assert json.loads(fallback_content) == json.loads(default_content)
+
 
 @pytest.mark.asyncio
 class TestTaskClass:
@@ -499,6 +535,70 @@ class TestElementEdgeCases:
             assert len(ids) == 3  # All unique
 
 
+@pytest.mark.asyncio
+class TestElementCreateBatcher:
+    """Test suite for the element persistence batcher."""
+
+    async def test_flush_falls_back_to_create_element(
+        self, mock_chainlit_context, mock_data_layer, monkeypatch
+    ):
+        """Test that a batch is persisted element by element by default."""
+        from chainlit import element as element_module
+
+        monkeypatch.setattr(element_module, "get_data_layer", lambda: mock_data_layer)
+
+        async with mock_chainlit_context:
+            batcher = element_module._ElementCreateBatcher()
+            batcher.enqueue(File(name="f1", url="https://example.com/1"))
+            batcher.enqueue(File(name="f2", url="https://example.com/2"))
+
+            await asyncio.sleep(batcher.flush_delay + 0.05)
+
+            assert mock_data_layer.create_element.await_count == 2
+
+    async def test_flush_uses_bulk_hook_when_available(
+        self, mock_chainlit_context, monkeypatch
+    ):
+        """Test that data layers exposing create_elements get one bulk call."""
+        from chainlit import element as element_module
+
+        bulk_data_layer = AsyncMock()
+        monkeypatch.setattr(element_module, "get_data_layer", lambda: bulk_data_layer)
+
+        async with mock_chainlit_context:
+            batcher = element_module._ElementCreateBatcher()
+            elements = [
+                File(name="f1", url="https://example.com/1"),
+                File(name="f2", url="https://example.com/2"),
+            ]
+            for element in elements:
+                batcher.enqueue(element)
+
+            await asyncio.sleep(batcher.flush_delay + 0.05)
+
+            bulk_data_layer.create_elements.assert_awaited_once_with(elements)
+            bulk_data_layer.create_element.assert_not_awaited()
+
+    async def test_remove_flushes_pending_create_first(
+        self, mock_chainlit_context, mock_data_layer, monkeypatch
+    ):
+        """Test that remove() drains the batch so create cannot land after delete."""
+        from chainlit import element as element_module
+
+        calls: list = []
+        mock_data_layer.create_element.side_effect = lambda *_: calls.append("create")
+        mock_data_layer.delete_element.side_effect = lambda *_: calls.append("delete")
+        monkeypatch.setattr(element_module, "get_data_layer", lambda: mock_data_layer)
+
+        async with mock_chainlit_context:
+            element = File(name="f1", url="https://example.com/1")
+            element_module._element_create_batcher.enqueue(element)
+
+            await element.remove()
+
+            assert calls == ["create", "delete"]
+
+
 @pytest.mark.asyncio
 class TestDataframeElement:
     """Test suite for Dataframe element."""
@@ -565,6 +665,19 @@ class TestDataframeElement:
             assert pd_parsed["index"] == pl_parsed["index"]
             assert pd_parsed["data"] == pl_parsed["data"]
 
+    async def test_dataframe_ids_are_unique_per_element(self, mock_chainlit_context):
+        """Test that identical content still yields a distinct id per element."""
+        import pandas as pd
+
+        async with mock_chainlit_context:
+            df = pd.DataFrame({"a": [1, 2]})
+
+            element1 = Dataframe(name="df", data=df)
+            element2 = Dataframe(name="df", data=df.copy())
+
+            assert element1.id != element2.id
+            uuid.UUID(element1.id)  # Still a valid UUID
+
     async def test_dataframe_polars_with_dates(self, mock_chainlit_context):
         """Test Dataframe element with polars date columns serializes correctly."""
         from datetime import date
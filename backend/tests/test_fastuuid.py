@@ -0,0 +1,44 @@
+import os
+import uuid
+
+import pytest
+
+from chainlit._fastuuid import fastuuid
+
+
+class TestFastUUID:
+    """Test suite for the buffered UUID generator."""
+
+    def test_produces_valid_uuid4(self):
+        """Test that fastuuid() output parses as a version-4 UUID."""
+        value = fastuuid()
+
+        parsed = uuid.UUID(value)
+        assert str(parsed) == value
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
+
+    def test_uniqueness_across_buffer_refills(self):
+        """Test that ids stay unique past the entropy buffer size."""
+        ids = {fastuuid() for _ in range(1000)}
+
+        assert len(ids) == 1000
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_fork_child_does_not_replay_parent_stream(self):
+        """Test that a forked child discards the inherited entropy buffer."""
+        fastuuid()  # Make sure a partially consumed buffer is inherited.
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write_fd, fastuuid().encode())
+            os._exit(0)
+        os.close(write_fd)
+        child_id = os.read(read_fd, 36).decode()
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        # Without the at-fork hook the child would emit the exact id the
+        # parent produces next.
+        assert child_id != fastuuid()